@@ -0,0 +1,209 @@
+import atexit
+import functools
+import logging
+import logging.handlers
+import queue
+import sys
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from pydantic import BaseSettings, ValidationError, root_validator
+from pydantic.env_settings import env_file_sentinel
+from pydantic.error_wrappers import ErrorWrapper
+from pydantic.errors import MissingError
+
+_LAZY_MAPPING_KEY = "__lazy_mapping__"
+
+_VALID_LOG_LEVELS = frozenset(
+    {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
+)
+
+
+class LazyMapping(Mapping):
+    """Read-only view over the merged settings sources (init kwargs,
+    environment, ``.env`` file) that defers the merge until first access.
+
+    Building the mapping is what pays the dotenv-parse cost, so instances
+    created with ``lazy_load`` enabled touch no environment state until a
+    field is actually read.
+    """
+
+    def __init__(self, loader: Callable[[], Dict[str, Any]]) -> None:
+        self._loader = loader
+        self._data: Optional[Dict[str, Any]] = None
+
+    def _materialize(self) -> Dict[str, Any]:
+        if self._data is None:
+            self._data = dict(self._loader())
+        return self._data
+
+    def __getitem__(self, key: str) -> Any:
+        return self._materialize()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._materialize())
+
+    def __len__(self) -> int:
+        return len(self._materialize())
+
+
+class Settings(BaseSettings):
+    """Application settings loaded from environment variables / .env file."""
+
+    # Discord
+    DISCORD_TOKEN: str
+    DISCORD_GUILD_ID: int
+
+    # OpenAI
+    OPENAI_API_KEY: str
+    OPENAI_MODEL: str = "gpt-4o-mini"
+    OPENAI_MAX_HISTORY: int = 10
+    OPENAI_AVAILABLE_MODELS: list = [
+        "gpt-4o",
+        "gpt-4o-mini",
+        "gpt-4-turbo",
+        "gpt-3.5-turbo",
+    ]
+
+    # MongoDB
+    MONGODB_USERNAME: str
+    MONGODB_PASSWORD: str
+    MONGODB_CLUSTER: str
+    MONGODB_DB_NAME: str = "nate"
+
+    # Logging
+    LOG_LEVEL: str = "INFO"
+
+    @root_validator(pre=True)
+    def normalize_inputs(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        """Normalize LOG_LEVEL and coerce DISCORD_GUILD_ID in a single pass."""
+        level = values.get("LOG_LEVEL")
+        if level is not None:
+            level = str(level).upper()
+            if level not in _VALID_LOG_LEVELS:
+                raise ValueError(
+                    f"LOG_LEVEL must be one of {sorted(_VALID_LOG_LEVELS)}"
+                )
+            values["LOG_LEVEL"] = level
+        guild_id = values.get("DISCORD_GUILD_ID")
+        if guild_id is not None:
+            try:
+                values["DISCORD_GUILD_ID"] = int(guild_id)
+            except (TypeError, ValueError):
+                raise ValueError("DISCORD_GUILD_ID must be an integer")
+        return values
+
+    def __init__(__pydantic_self__, **values: Any) -> None:
+        if getattr(__pydantic_self__.__config__, "lazy_load", False):
+            # Skip eager validation entirely; fields are resolved (and
+            # validated) one at a time in __getattribute__ on first access.
+            # The sentinel keeps Config.env_file semantics inside
+            # _build_values, same as BaseSettings.__init__'s default.
+            env_file = values.pop("_env_file", env_file_sentinel)
+            object.__setattr__(__pydantic_self__, "__fields_set__", set())
+            __pydantic_self__.__dict__[_LAZY_MAPPING_KEY] = LazyMapping(
+                lambda: __pydantic_self__._build_values(
+                    values, _env_file=env_file
+                )
+            )
+        else:
+            super().__init__(**values)
+
+    def __getattribute__(self, name: str) -> Any:
+        if name in type(self).__fields__:
+            d = object.__getattribute__(self, "__dict__")
+            if name not in d and _LAZY_MAPPING_KEY in d:
+                d[name] = self._resolve_lazy_field(name, d[_LAZY_MAPPING_KEY])
+        return object.__getattribute__(self, name)
+
+    def _resolve_lazy_field(self, name: str, mapping: LazyMapping) -> Any:
+        field = type(self).__fields__[name]
+        if name in mapping:
+            values = {name: mapping[name]}
+            for pre_validator in type(self).__pre_root_validators__:
+                values = pre_validator(type(self), values)
+            raw = values[name]
+        elif not field.required:
+            raw = field.get_default()
+        else:
+            raise ValidationError(
+                [ErrorWrapper(MissingError(), loc=name)], type(self)
+            )
+        value, error = field.validate(raw, {}, loc=name, cls=type(self))
+        if error:
+            raise ValidationError([error], type(self))
+        return value
+
+    class Config:
+        env_file = ".env"
+        case_sensitive = True
+        # Opt-in: resolve fields (including secrets such as MONGODB_PASSWORD
+        # and OPENAI_API_KEY) on first attribute access instead of eagerly in
+        # __init__. Off by default for backwards compatibility.
+        lazy_load = False
+
+
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide ``Settings`` instance.
+
+    The result is memoized so the ``.env`` file is parsed and validators run
+    only once per process, no matter how many callers import ``settings``.
+    """
+    return Settings()
+
+
+def reload_settings() -> Settings:
+    """Drop the cached ``Settings`` and rebuild from the environment.
+
+    Intended for tests that mutate environment variables.
+    """
+    get_settings.cache_clear()
+    return get_settings()
+
+
+settings = get_settings()
+
+
+# Bound the log queue so a burst of records degrades to dropped log lines
+# rather than unbounded memory growth.
+_LOG_QUEUE_SIZE = 10000
+
+
+class _DropOnFullQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that silently drops records when the queue is full.
+
+    The stock handler routes ``queue.Full`` through ``handleError``, which
+    writes to stderr from the caller's thread -- exactly the blocking I/O the
+    queue exists to avoid.
+    """
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+
+def setup_logging() -> None:
+    """Configure root logging according to ``settings.LOG_LEVEL``.
+
+    Records are handed off through a queue to a background listener thread,
+    so log calls on the event loop never block on stderr write syscalls.
+    """
+    log_queue: queue.Queue = queue.Queue(maxsize=_LOG_QUEUE_SIZE)
+
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+    )
+
+    root = logging.getLogger()
+    root.setLevel(settings.LOG_LEVEL)
+    root.addHandler(_DropOnFullQueueHandler(log_queue))
+
+    listener = logging.handlers.QueueListener(
+        log_queue, stream_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
@@ -0,0 +1,71 @@
+import asyncio
+import logging
+
+import discord
+from discord.ext import commands
+
+from config.settings import settings, setup_logging
+from providers.openai import OpenAIProvider
+from storage.database import Conversation, get_db_client
+
+setup_logging()
+logger = logging.getLogger(__name__)
+
+intents = discord.Intents.default()
+intents.message_content = True
+
+bot = commands.Bot(command_prefix="!", intents=intents)
+provider = OpenAIProvider()
+db = get_db_client()
+
+
+@bot.event
+async def on_ready() -> None:
+    logger.info("Logged in as %s", bot.user)
+    db.start_cleanup_task(bot)
+
+
+@bot.event
+async def on_message(message: discord.Message) -> None:
+    if message.author.bot:
+        return
+    if bot.user is None or bot.user not in message.mentions:
+        return
+
+    channel_id = str(message.channel.id)
+    conversation = await db.get_conversation(channel_id)
+    if conversation is None:
+        conversation = Conversation(channel_id=channel_id)
+    conversation.messages.append(
+        {"role": "user", "content": message.clean_content}
+    )
+
+    history = conversation.messages[-settings.OPENAI_MAX_HISTORY:]
+    async with message.channel.typing():
+        response = await provider.generate_response(history)
+
+    conversation.messages.append(
+        {"role": "assistant", "content": response.content}
+    )
+    await db.save_conversation(conversation)
+    await message.reply(response.content)
+
+
+async def _run() -> None:
+    try:
+        async with bot:
+            await bot.start(settings.DISCORD_TOKEN)
+    finally:
+        # Still inside the running loop: Motor and the OpenAI client are
+        # bound to it, so the final flush and pool teardown must happen
+        # before the loop closes.
+        await provider.aclose()
+        await db.aclose()
+
+
+def main() -> None:
+    asyncio.run(_run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Sequence, Union
+
+import msgspec
+
+
+class Message(msgspec.Struct, frozen=True, gc=False):
+    """A single chat message exchanged with a model."""
+
+    role: str
+    content: str
+    name: Optional[str] = None
+
+    def as_dict(self) -> Dict[str, str]:
+        """Return the wire-format dict for this message."""
+        d = {"role": self.role, "content": self.content}
+        if self.name is not None:
+            d["name"] = self.name
+        return d
+
+
+class ModelResponse(msgspec.Struct, frozen=True, gc=False):
+    """Response returned by a provider, with token accounting."""
+
+    content: str
+    model: str
+    usage: Dict[str, int]
+
+
+class BaseProvider(ABC):
+    """Common interface for LLM providers."""
+
+    @abstractmethod
+    async def generate_response(
+        self,
+        messages: Sequence[Union[Message, Dict[str, str]]],
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+    ) -> ModelResponse:
+        """Generate a completion for the given message history.
+
+        ``messages`` may be ``Message`` instances or already wire-format
+        dicts (as stored in a ``Conversation``); dicts are passed through
+        without re-marshalling.
+        """
+
+    @abstractmethod
+    async def validate_model(self, model: str) -> bool:
+        """Return whether ``model`` is usable with this provider."""
+
+    @abstractmethod
+    def get_available_models(self) -> Sequence[str]:
+        """List the models this provider can serve."""
@@ -0,0 +1,99 @@
+import logging
+from typing import Dict, Optional, Sequence, Union
+
+import httpx
+import openai
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+
+from config.settings import settings
+from providers.base import BaseProvider, Message, ModelResponse
+
+logger = logging.getLogger(__name__)
+
+# Transient failures worth retrying; anything else propagates immediately.
+_RETRYABLE_ERRORS = (openai.RateLimitError, openai.APIConnectionError)
+
+
+class OpenAIProvider(BaseProvider):
+    """LLM provider backed by the OpenAI chat completions API."""
+
+    def __init__(self) -> None:
+        # frozenset for O(1) membership in validate_model; ordered tuple so
+        # get_available_models hands out an immutable snapshot.
+        self._available_models = frozenset(settings.OPENAI_AVAILABLE_MODELS)
+        self._available_models_ordered = tuple(settings.OPENAI_AVAILABLE_MODELS)
+        # One client per provider: concurrent calls share its keep-alive
+        # connection pool instead of paying a TLS handshake each.
+        self._client = openai.AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            # Retry policy is owned by _call_api's tenacity decorator.
+            max_retries=0,
+        )
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential_jitter(initial=1, max=10),
+        retry=retry_if_exception_type(_RETRYABLE_ERRORS),
+        reraise=True,
+    )
+    async def _call_api(self, **kwargs) -> openai.types.chat.ChatCompletion:
+        return await self._client.chat.completions.create(**kwargs)
+
+    async def generate_response(
+        self,
+        messages: Sequence[Union[Message, Dict[str, str]]],
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+    ) -> ModelResponse:
+        model = model or settings.OPENAI_MODEL
+        # Histories loaded from storage are already wire-format dicts; pass
+        # all-dict lists straight through instead of rebuilding N dicts per
+        # turn, and convert per element otherwise so mixed or non-list
+        # sequences still serialize.
+        if isinstance(messages, list) and all(
+            isinstance(msg, dict) for msg in messages
+        ):
+            formatted_messages = messages
+        else:
+            formatted_messages = [
+                msg if isinstance(msg, dict) else msg.as_dict()
+                for msg in messages
+            ]
+        logger.debug("Generating response with model %s", model)
+        response = await self._call_api(
+            model=model,
+            messages=formatted_messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+        usage = response.usage
+        return ModelResponse(
+            content=response.choices[0].message.content or "",
+            model=response.model,
+            usage={
+                "prompt_tokens": usage.prompt_tokens,
+                "completion_tokens": usage.completion_tokens,
+                "total_tokens": usage.total_tokens,
+            }
+            if usage
+            else {},
+        )
+
+    async def aclose(self) -> None:
+        """Release the underlying HTTP connection pool."""
+        await self._client.close()
+
+    async def validate_model(self, model: str) -> bool:
+        # async only because the BaseProvider interface is; the check itself
+        # is a set lookup.
+        return model in self._available_models
+
+    def get_available_models(self) -> Sequence[str]:
+        return self._available_models_ordered
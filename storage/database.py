@@ -0,0 +1,320 @@
+import asyncio
+import functools
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+from urllib.parse import quote_plus
+
+import msgspec
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Keep $in/$nin id arrays comfortably under the 16MB BSON document limit.
+_ID_CHUNK_SIZE = 10000
+
+# Conversations untouched for this long are expired server-side by the TTL
+# index on updated_at.
+_CONVERSATION_TTL_DAYS = 30
+
+# Daily cleanup runs at this UTC hour, anchored to the wall clock so late
+# loop wakeups don't accumulate drift.
+_CLEANUP_HOUR_UTC = 3
+
+# Saves buffered in-process coalesce for this long before one bulk_write.
+_FLUSH_INTERVAL_SECONDS = 0.5
+
+# Built once per process; credentials are percent-encoded so passwords with
+# reserved characters (@, :, /) can't corrupt the URI.
+_MONGO_URI = (
+    f"mongodb+srv://{quote_plus(settings.MONGODB_USERNAME)}"
+    f":{quote_plus(settings.MONGODB_PASSWORD)}"
+    f"@{settings.MONGODB_CLUSTER}/{settings.MONGODB_DB_NAME}"
+    "?retryWrites=true&w=majority&appName=Cluster0"
+)
+
+
+class Conversation(msgspec.Struct):
+    """Per-channel chat history persisted in MongoDB."""
+
+    channel_id: str
+    messages: List[Dict[str, str]] = []
+    created_at: datetime = msgspec.field(
+        default_factory=lambda: datetime.now(timezone.utc)
+    )
+    updated_at: datetime = msgspec.field(
+        default_factory=lambda: datetime.now(timezone.utc)
+    )
+
+    def __post_init__(self) -> None:
+        # Keep only the most recent OPENAI_MAX_HISTORY messages; long-lived
+        # channels would otherwise grow the list without bound, inflating
+        # every read, save, and prompt built from it.
+        limit = settings.OPENAI_MAX_HISTORY
+        if len(self.messages) > limit:
+            self.messages = self.messages[-limit:]
+
+
+class DatabaseClient:
+    """Async MongoDB client for conversation storage."""
+
+    def __init__(self) -> None:
+        logger.info("Connecting to MongoDB cluster: %s", settings.MONGODB_CLUSTER)
+        # Motor's default pool of 100 is oversized for typical command
+        # volume; a smaller warm pool keeps handshake cost down.
+        self.client = AsyncIOMotorClient(
+            _MONGO_URI, maxPoolSize=50, minPoolSize=5
+        )
+        self.db = self.client[settings.MONGODB_DB_NAME]
+        self.conversations = self.db.conversations
+        self._cleanup_task: Optional[asyncio.Task] = None
+        self._stop = asyncio.Event()
+        self._indexes_ready = False
+        self._pending: Dict[str, Conversation] = {}
+        self._flush_event = asyncio.Event()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._index_task: Optional[asyncio.Task] = None
+        try:
+            # Keep a reference: a bare create_task result can be garbage-
+            # collected before it finishes.
+            self._index_task = asyncio.get_running_loop().create_task(
+                self.ensure_indexes()
+            )
+        except RuntimeError:
+            # No loop running yet; the cleanup routine ensures indexes later.
+            pass
+        else:
+            self._index_task.add_done_callback(self._log_index_task_result)
+
+    @staticmethod
+    def _log_index_task_result(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(
+                "Failed to ensure conversation indexes",
+                exc_info=task.exception(),
+            )
+
+    async def ensure_indexes(self) -> None:
+        """Create the indexes our queries rely on (idempotent).
+
+        The unique ``channel_id`` index backs every per-channel lookup and
+        upsert, and the TTL index on ``updated_at`` lets MongoDB expire stale
+        conversations natively instead of this process scanning for them.
+        """
+        if self._indexes_ready:
+            return
+        await self.conversations.create_index("channel_id", unique=True)
+        await self.conversations.create_index(
+            "updated_at", expireAfterSeconds=_CONVERSATION_TTL_DAYS * 86400
+        )
+        self._indexes_ready = True
+
+    async def get_conversation(self, channel_id: str) -> Optional[Conversation]:
+        # A save for this channel may still be buffered; serving it keeps
+        # back-to-back messages in one channel from reading a stale (or
+        # missing) document and restarting the history.
+        pending = self._pending.get(channel_id)
+        if pending is not None:
+            return pending
+        try:
+            result = await self.conversations.find_one({"channel_id": channel_id})
+            if result:
+                # msgspec.convert skips pydantic-style validator dispatch and
+                # ignores Mongo's _id field.
+                return msgspec.convert(result, Conversation, strict=False)
+            return None
+        except Exception:
+            logger.exception(
+                "Failed to fetch conversation for channel %s", channel_id
+            )
+            raise
+
+    async def save_conversation(self, conversation: Conversation) -> None:
+        """Queue a conversation write; a background task flushes batches.
+
+        The caller returns after an in-memory update, keeping the Mongo
+        round-trip off the request-response path. Saves for the same channel
+        arriving within the flush interval coalesce into a single upsert.
+        """
+        conversation.updated_at = datetime.now(timezone.utc)
+        self._pending[conversation.channel_id] = conversation
+        self._flush_event.set()
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await self._flush_event.wait()
+            # Leave a short window so back-to-back saves for the same
+            # channel collapse into one write.
+            await asyncio.sleep(_FLUSH_INTERVAL_SECONDS)
+            self._flush_event.clear()
+            await self._flush_pending()
+
+    async def _flush_pending(self) -> None:
+        batch, self._pending = self._pending, {}
+        if not batch:
+            return
+        ops = [
+            UpdateOne(
+                {"channel_id": conv.channel_id},
+                {
+                    "$set": {
+                        "messages": conv.messages[
+                            -settings.OPENAI_MAX_HISTORY :
+                        ],
+                        "updated_at": conv.updated_at,
+                    },
+                    "$setOnInsert": {
+                        "channel_id": conv.channel_id,
+                        "created_at": conv.created_at,
+                    },
+                },
+                upsert=True,
+            )
+            for conv in batch.values()
+        ]
+        flushed = False
+        try:
+            await self.conversations.bulk_write(ops, ordered=False)
+            flushed = True
+            logger.debug("Flushed %d conversation saves", len(ops))
+        except Exception:
+            logger.exception(
+                "Failed to flush %d conversation saves; requeueing", len(ops)
+            )
+        finally:
+            # The requeue must also run when the task is cancelled
+            # mid-write (CancelledError is a BaseException), so aclose's
+            # final flush still sees the batch. Newer saves that arrived
+            # meanwhile win over the requeued ones.
+            if not flushed:
+                for channel_id, conv in batch.items():
+                    self._pending.setdefault(channel_id, conv)
+                self._flush_event.set()
+
+    async def delete_conversation(self, channel_id: str) -> None:
+        try:
+            await self.conversations.delete_one({"channel_id": channel_id})
+        except Exception:
+            logger.exception(
+                "Failed to delete conversation for channel %s", channel_id
+            )
+            raise
+
+    def start_cleanup_task(self, bot) -> None:
+        """Start the periodic task that removes conversations for channels
+        the bot can no longer see."""
+        if self._cleanup_task is None:
+            self._stop.clear()
+            self._cleanup_task = asyncio.create_task(self._cleanup_routine(bot))
+
+    async def _cleanup_routine(self, bot) -> None:
+        while not self._stop.is_set():
+            try:
+                await self.ensure_indexes()
+
+                if any(guild.unavailable for guild in bot.guilds):
+                    # Unavailable guilds report no channels, so their
+                    # conversations would look stale; try again next run.
+                    logger.warning(
+                        "Skipping conversation cleanup: some guilds are "
+                        "unavailable"
+                    )
+                else:
+                    active_channel_ids = {
+                        str(channel.id)
+                        for guild in bot.guilds
+                        for channel in guild.text_channels
+                    }
+
+                    deleted = await self._delete_stale_conversations(
+                        active_channel_ids
+                    )
+                    if deleted:
+                        logger.info(
+                            "Cleaned up %d stale conversations", deleted
+                        )
+            except Exception:
+                logger.exception("Conversation cleanup failed")
+
+            # Wait until the next fixed run time, but wake immediately if
+            # stop_cleanup_task sets the event.
+            now = datetime.now(timezone.utc)
+            next_run = (now + timedelta(days=1)).replace(
+                hour=_CLEANUP_HOUR_UTC, minute=0, second=0, microsecond=0
+            )
+            try:
+                await asyncio.wait_for(
+                    self._stop.wait(),
+                    timeout=(next_run - now).total_seconds(),
+                )
+            except asyncio.TimeoutError:
+                pass
+
+    async def _delete_stale_conversations(self, active_channel_ids: set) -> int:
+        """Delete conversations whose channel the bot can no longer see.
+
+        The negative match runs server-side via ``$nin``, so stored channel
+        ids never have to be streamed into this process.
+        """
+        if not active_channel_ids:
+            # An empty $nin matches every document; seeing no channels means
+            # the gateway state is not trustworthy, never that every stored
+            # conversation is stale.
+            return 0
+        if len(active_channel_ids) <= _ID_CHUNK_SIZE:
+            result = await self.conversations.delete_many(
+                {"channel_id": {"$nin": list(active_channel_ids)}},
+                hint="channel_id_1",
+            )
+            return result.deleted_count
+
+        # A huge active set would push a single $nin array toward the BSON
+        # size limit; diff against the stored ids (one distinct round-trip)
+        # and delete the stale ones in bounded $in chunks instead.
+        stored = await self.conversations.distinct("channel_id")
+        stale = [cid for cid in stored if cid not in active_channel_ids]
+        deleted = 0
+        for start in range(0, len(stale), _ID_CHUNK_SIZE):
+            chunk = stale[start : start + _ID_CHUNK_SIZE]
+            result = await self.conversations.delete_many(
+                {"channel_id": {"$in": chunk}},
+                hint="channel_id_1",
+            )
+            deleted += result.deleted_count
+        return deleted
+
+    def stop_cleanup_task(self) -> None:
+        self._stop.set()
+        self._cleanup_task = None
+
+    async def aclose(self) -> None:
+        """Stop background work, flush buffered saves, and close the pool."""
+        self.stop_cleanup_task()
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                # Wait the cancellation out so an in-flight _flush_pending
+                # can't race the final flush below.
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        if self._pending:
+            await self._flush_pending()
+        self.client.close()
+
+
+@functools.lru_cache(maxsize=1)
+def get_db_client() -> DatabaseClient:
+    """Return the process-wide ``DatabaseClient``.
+
+    Memoized so repeated imports/calls share one Motor connection pool
+    instead of each opening their own. Tests can call
+    ``get_db_client.cache_clear()`` for isolation.
+    """
+    return DatabaseClient()
@@ -0,0 +1,15 @@
+import os
+
+# config.settings builds the module-level settings instance at import, so
+# the required variables must exist before any application module is
+# imported by a test.
+_REQUIRED_ENV = {
+    "DISCORD_TOKEN": "test-token",
+    "DISCORD_GUILD_ID": "123",
+    "OPENAI_API_KEY": "test-key",
+    "MONGODB_USERNAME": "test-user",
+    "MONGODB_PASSWORD": "test-password",
+    "MONGODB_CLUSTER": "cluster.example.com",
+}
+for _key, _value in _REQUIRED_ENV.items():
+    os.environ.setdefault(_key, _value)
@@ -0,0 +1,63 @@
+import asyncio
+
+from storage.database import Conversation, DatabaseClient
+
+
+class _FakeCollection:
+    """Collection double capturing bulk writes; reads are not expected."""
+
+    def __init__(self):
+        self.bulk_writes = []
+
+    async def bulk_write(self, ops, ordered=True):
+        self.bulk_writes.append(list(ops))
+
+
+def _client_with_fake_collection():
+    # Constructed outside a running loop so no index task is scheduled.
+    client = DatabaseClient()
+    client.conversations = _FakeCollection()
+    return client
+
+
+def test_same_channel_saves_coalesce_and_flush_on_close():
+    client = _client_with_fake_collection()
+    first = Conversation(
+        channel_id="1", messages=[{"role": "user", "content": "a"}]
+    )
+    second = Conversation(
+        channel_id="1",
+        messages=[
+            {"role": "user", "content": "a"},
+            {"role": "assistant", "content": "b"},
+        ],
+    )
+
+    async def run():
+        await client.save_conversation(first)
+        await client.save_conversation(second)
+        # Both saves landed within one flush window: the newer conversation
+        # replaced the older one in the buffer.
+        assert client._pending == {"1": second}
+        await client.aclose()
+
+    asyncio.run(run())
+    # aclose flushed the buffer exactly once, with one coalesced upsert.
+    assert len(client.conversations.bulk_writes) == 1
+    assert len(client.conversations.bulk_writes[0]) == 1
+
+
+def test_get_conversation_serves_buffered_save():
+    client = _client_with_fake_collection()
+    conv = Conversation(
+        channel_id="42", messages=[{"role": "user", "content": "hi"}]
+    )
+
+    async def run():
+        await client.save_conversation(conv)
+        # The fake collection has no find_one; reaching the database here
+        # would raise AttributeError.
+        assert await client.get_conversation("42") is conv
+        await client.aclose()
+
+    asyncio.run(run())
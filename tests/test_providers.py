@@ -0,0 +1,65 @@
+import asyncio
+
+from providers.base import Message
+from providers.openai import OpenAIProvider
+
+
+class _FakeUsage:
+    prompt_tokens = 1
+    completion_tokens = 2
+    total_tokens = 3
+
+
+class _FakeChatMessage:
+    content = "hi"
+
+
+class _FakeChoice:
+    message = _FakeChatMessage()
+
+
+class _FakeResponse:
+    choices = [_FakeChoice()]
+    model = "gpt-4o-mini"
+    usage = _FakeUsage()
+
+
+def _provider_with_capture(captured):
+    provider = OpenAIProvider()
+
+    async def fake_call_api(**kwargs):
+        captured.update(kwargs)
+        return _FakeResponse()
+
+    provider._call_api = fake_call_api
+    return provider
+
+
+def test_dict_list_passes_through_unchanged():
+    captured = {}
+    provider = _provider_with_capture(captured)
+    history = [{"role": "user", "content": "hello"}]
+    asyncio.run(provider.generate_response(history))
+    assert captured["messages"] is history
+
+
+def test_tuple_of_dicts_is_converted():
+    captured = {}
+    provider = _provider_with_capture(captured)
+    history = ({"role": "user", "content": "hello"},)
+    asyncio.run(provider.generate_response(history))
+    assert captured["messages"] == [{"role": "user", "content": "hello"}]
+
+
+def test_mixed_list_converts_message_objects():
+    captured = {}
+    provider = _provider_with_capture(captured)
+    history = [
+        {"role": "user", "content": "hello"},
+        Message(role="assistant", content="hi"),
+    ]
+    asyncio.run(provider.generate_response(history))
+    assert captured["messages"] == [
+        {"role": "user", "content": "hello"},
+        {"role": "assistant", "content": "hi"},
+    ]
@@ -0,0 +1,34 @@
+from config.settings import Settings
+
+
+class LazySettings(Settings):
+    class Config(Settings.Config):
+        lazy_load = True
+
+
+def test_lazy_field_resolves_from_env(monkeypatch):
+    monkeypatch.setenv("MONGODB_PASSWORD", "from-env")
+    s = LazySettings()
+    assert s.MONGODB_PASSWORD == "from-env"
+
+
+def test_lazy_field_resolves_from_dotenv(tmp_path, monkeypatch):
+    monkeypatch.delenv("MONGODB_PASSWORD", raising=False)
+    env_file = tmp_path / ".env"
+    env_file.write_text("MONGODB_PASSWORD=from-dotenv\n")
+    s = LazySettings(_env_file=str(env_file))
+    assert s.MONGODB_PASSWORD == "from-dotenv"
+
+
+def test_lazy_field_is_validated_on_access(monkeypatch):
+    monkeypatch.setenv("LOG_LEVEL", "debug")
+    s = LazySettings()
+    assert s.LOG_LEVEL == "DEBUG"
+
+
+def test_lazy_field_caches_after_first_access(monkeypatch):
+    monkeypatch.setenv("MONGODB_PASSWORD", "first")
+    s = LazySettings()
+    assert s.MONGODB_PASSWORD == "first"
+    monkeypatch.setenv("MONGODB_PASSWORD", "second")
+    assert s.MONGODB_PASSWORD == "first"